@@ -1,9 +1,13 @@
-from flask import Flask, render_template, request, jsonify
-from ai_brain import ai
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
+from ai_brain import ai, KNOWLEDGE_FIELDS, StorageUnavailable
 import os
+import json
 
 app = Flask(__name__)
 
+MAX_BATCH_QUESTIONS = int(os.environ.get('MAX_BATCH_QUESTIONS', '200'))
+MAX_KNOWLEDGE_PAGE = int(os.environ.get('MAX_KNOWLEDGE_PAGE', '1000'))
+
 @app.route('/')
 def home():
     """Main page"""
@@ -27,15 +31,50 @@ def chat():
     
     # Get response
     result = ai.get_response(question)
-    stats = ai.get_stats()
     
     return jsonify({
         'response': result['answer'],
         'source': result.get('source', 'unknown'),
         'found_in_memory': result.get('found', False),
-        'knowledge_count': stats['training_examples'],
+        'knowledge_count': ai.knowledge_size,
         'current_mode': 'Learning Mode',
-        'confidence': result.get('confidence', 0.0)
+        'confidence': result.get('confidence', 0.0),
+        'alternatives': [{
+            'question': alt['question'],
+            'confidence': alt['confidence']
+        } for alt in result.get('alternatives', [])]
+    })
+
+@app.route('/chat/batch', methods=['POST'])
+def chat_batch():
+    """Handle many chat questions in one request"""
+    data = request.json or {}
+    questions = data.get('questions')
+    
+    if not isinstance(questions, list) or not questions:
+        return jsonify({
+            'error': 'questions must be a non-empty list'
+        }), 400
+    if len(questions) > MAX_BATCH_QUESTIONS:
+        return jsonify({
+            'error': f'At most {MAX_BATCH_QUESTIONS} questions per batch'
+        }), 400
+    if not all(isinstance(q, str) and q.strip() for q in questions):
+        return jsonify({
+            'error': 'Every question must be a non-empty string'
+        }), 400
+    
+    results = ai.get_responses([q.strip() for q in questions])
+    
+    return jsonify({
+        'responses': [{
+            'response': result['answer'],
+            'source': result.get('source', 'unknown'),
+            'found_in_memory': result.get('found', False),
+            'confidence': result.get('confidence', 0.0)
+        } for result in results],
+        'knowledge_count': ai.knowledge_size,
+        'current_mode': 'Learning Mode'
     })
 
 @app.route('/teach', methods=['POST'])
@@ -52,11 +91,11 @@ def teach():
     
     # Manually teach the AI
     lang = ai.detect_language(question)
-    success = ai.add_training_data(question, answer, 'user_taught', lang)
-    
-    # Retrain if enough data
-    if len(ai.training_data) >= 10:
-        ai.train_model()
+    # Indexed on the spot; no retrain needed
+    try:
+        success = ai.add_training_data(question, answer, 'user_taught', lang)
+    except StorageUnavailable as e:
+        return jsonify({'error': str(e)}), 503
     
     stats = ai.get_stats()
     
@@ -71,40 +110,142 @@ def teach():
             'error': 'Failed to learn (duplicate question)'
         }), 400
 
+@app.route('/bulk-train', methods=['POST'])
+def bulk_train():
+    """Handle bulk teaching requests"""
+    data = request.json or {}
+    entries = data.get('entries')
+    
+    if not isinstance(entries, list) or not entries:
+        return jsonify({
+            'error': 'entries must be a non-empty list'
+        }), 400
+    
+    # Validate the whole payload before writing anything
+    rows = []
+    errors = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.append(f'entry {i}: must be an object')
+            continue
+        question = entry.get('question')
+        answer = entry.get('answer')
+        if not isinstance(question, str) or not question.strip() \
+                or not isinstance(answer, str) or not answer.strip():
+            errors.append(f'entry {i}: question and answer are required')
+            continue
+        category = entry.get('category') or 'general'
+        language = entry.get('language') or ai.detect_language(question)
+        rows.append((question, answer, str(category), str(language)))
+    
+    if errors:
+        return jsonify({
+            'error': f'{len(errors)} invalid entries',
+            'details': errors[:20]
+        }), 400
+    
+    try:
+        success_count, failed_count = ai.add_training_data_bulk(rows)
+    except StorageUnavailable as e:
+        return jsonify({'error': str(e)}), 503
+    
+    return jsonify({
+        'success': True,
+        'success_count': success_count,
+        'failed_count': failed_count,
+        'total_knowledge': ai.knowledge_size
+    })
+
 @app.route('/stats', methods=['GET'])
 def stats():
     """Get AI statistics"""
     return jsonify(ai.get_stats())
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics: stage latencies, response sources, confidence"""
+    return Response(ai.get_metrics(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/train', methods=['POST'])
 def train():
-    """Manually trigger model training"""
+    """Manually trigger model training (runs in the background)"""
     ai.train_model()
     stats = ai.get_stats()
     
     return jsonify({
         'success': True,
-        'message': 'Model retrained successfully!',
+        'message': 'Model retraining started!',
         'stats': stats
     })
 
 @app.route('/knowledge', methods=['GET'])
 def knowledge():
-    """Get all knowledge entries"""
-    data = ai.get_all_training_data()
+    """Get one page of knowledge entries
     
-    # Convert MongoDB ObjectId to string
-    for item in data:
-        item['_id'] = str(item['_id'])
-        if 'created_at' in item:
-            item['created_at'] = str(item['created_at'])
+    Query parameters: limit, after (next_cursor of the previous page),
+    category, language, fields (comma separated) and stream=1 for a
+    chunked response.
+    """
+    try:
+        limit = int(request.args.get('limit', 100))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_KNOWLEDGE_PAGE:
+        return jsonify({
+            'error': f'limit must be between 1 and {MAX_KNOWLEDGE_PAGE}'
+        }), 400
+    
+    fields = KNOWLEDGE_FIELDS
+    if request.args.get('fields'):
+        fields = tuple(f.strip() for f in request.args['fields'].split(',') if f.strip())
+        unknown = [f for f in fields if f not in KNOWLEDGE_FIELDS]
+        if unknown:
+            return jsonify({
+                'error': f'Unknown fields: {", ".join(unknown)}'
+            }), 400
+    
+    # One extra entry tells whether there is a next page
+    try:
+        rows = ai.iter_knowledge(request.args.get('after'), limit + 1,
+                                 request.args.get('category'), request.args.get('language'), fields)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except StorageUnavailable as e:
+        return jsonify({'error': str(e)}), 503
+    
+    if request.args.get('stream') in ('1', 'true'):
+        return Response(stream_with_context(_stream_page(rows, limit)), mimetype='application/json')
+    
+    data = []
+    next_cursor = None
+    for cursor, entry in rows:
+        if len(data) == limit:
+            next_cursor = last_cursor
+            break
+        data.append(entry)
+        last_cursor = cursor
     
     return jsonify({
         'success': True,
         'count': len(data),
-        'knowledge': data
+        'knowledge': data,
+        'next_cursor': next_cursor
     })
 
+def _stream_page(rows, limit):
+    """Same body as /knowledge, written entry by entry"""
+    yield '{"success": true, "knowledge": ['
+    count = 0
+    next_cursor = None
+    for cursor, entry in rows:
+        if count == limit:
+            next_cursor = last_cursor
+            break
+        yield (',' if count else '') + json.dumps(entry)
+        count += 1
+        last_cursor = cursor
+    yield f'], "count": {count}, "next_cursor": {json.dumps(next_cursor)}}}'
+
 @app.route('/delete', methods=['POST'])
 def delete():
     """Delete a knowledge entry"""
@@ -114,7 +255,10 @@ def delete():
     if not question:
         return jsonify({'error': 'Question required'}), 400
     
-    success = ai.delete_knowledge(question)
+    try:
+        success = ai.delete_knowledge(question)
+    except StorageUnavailable as e:
+        return jsonify({'error': str(e)}), 503
     
     if success:
         return jsonify({
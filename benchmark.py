@@ -0,0 +1,259 @@
+"""Micro-benchmarks for the SmartRobloxAI hot paths (memory storage mode)
+
+    python benchmark.py                                  # 1k, 10k and 100k entries
+    python benchmark.py --sizes 1000,1000000 --output results.json
+    python benchmark.py --baseline ''                    # no comparison
+
+Each corpus size runs in its own process, so peak RSS is per size. Results
+are written as JSON and compared against benchmark_baseline.json (or the
+--baseline file): any operation whose p50 or p90 got slower than the
+tolerance allows is reported and the exit code is 1. The committed
+baseline was recorded on one machine (see its meta); on another, record
+your own with --output benchmark_baseline.json before changing the code.
+"""
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import subprocess
+
+# Memory storage only: no shared artifacts and no response cache in the way
+os.environ['AI_ARTIFACT_DIR'] = ''
+os.environ['AI_RESPONSE_CACHE_SIZE'] = '0'
+
+DEFAULT_SIZES = '1000,10000,100000'
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+EN_ACTIONS = ['how do i make', 'how to create', 'how can i use', 'what is', 'show me an example of',
+              'why does', 'can i change', 'how to fix', 'how do i script', 'what are',
+              'how to animate', 'how do i move']
+TL_ACTIONS = ['paano gumawa ng', 'paano gamitin ang', 'ano ang', 'bakit hindi gumagana ang',
+              'pwede bang baguhin ang', 'halimbawa ng', 'paano ayusin ang', 'paano ilipat ang',
+              'ano ang gamit ng', 'paano gawin ang']
+SUBJECTS = ['part', 'brick', 'gui', 'screengui', 'frame', 'textbutton', 'textlabel', 'humanoid',
+            'localplayer', 'character', 'tween', 'tweenservice', 'remote event', 'remotefunction',
+            'datastore', 'leaderstats', 'proximity prompt', 'click detector', 'touched event',
+            'cframe', 'vector3', 'udim2', 'module script', 'local script', 'server script',
+            'while loop', 'for loop', 'table', 'dictionary', 'function', 'spawn point',
+            'teleport service', 'sound', 'animation', 'camera', 'lighting', 'billboard gui',
+            'tool', 'badge', 'gamepass', 'kill brick', 'health bar', 'shop gui', 'door',
+            'timer', 'leaderboard', 'checkpoint', 'raycast', 'particle emitter', 'weld']
+MODIFIERS = ['red', 'blue', 'anchored', 'invisible', 'spinning', 'moving', 'glowing', 'big',
+             'small', 'random', 'rainbow', 'fading', 'bouncing', 'sliding', 'custom', 'simple',
+             'advanced', 'multiplayer', 'saved', 'timed', 'locked', 'hidden', 'animated',
+             'transparent', 'neon', 'wooden', 'metal', 'falling', 'rotating', 'flashing',
+             'team', 'vip', 'daily', 'admin', 'mobile', 'server side', 'client side', 'global',
+             'nested', 'cloned']
+EN_CONTEXTS = ['in roblox', 'with lua', 'in roblox studio', 'for my game', 'on touch', 'when clicked',
+               'for all players', 'on the server', 'on the client', 'every second', 'after death',
+               'in a loop', 'with a script', 'for beginners', 'without lag', 'in an obby',
+               'in a tycoon', 'in a simulator', 'for mobile', 'with tweens']
+TL_CONTEXTS = ['sa roblox', 'gamit ang lua', 'sa roblox studio', 'para sa laro ko', 'kapag hinawakan',
+               'kapag pinindot', 'para sa lahat ng player', 'sa server', 'sa client', 'bawat segundo',
+               'pagkatapos mamatay', 'sa loob ng loop', 'gamit ang script', 'para sa baguhan',
+               'nang walang lag', 'sa obby', 'sa tycoon', 'sa simulator', 'sa mobile', 'gamit ang tween']
+EN_ANSWERS = ['Use Instance.new("{s}") and set its Parent to workspace.',
+              'Connect a function to the event, then change the {s} properties inside it.',
+              'Put this in a Script: local {s} = workspace:WaitForChild("{s}")']
+TL_ANSWERS = ['Gamitin ang Instance.new("{s}") at ilagay sa workspace.',
+              'Ikonekta ang function sa event, tapos baguhin ang {s}.',
+              'Ilagay ito sa Script: local {s} = workspace:WaitForChild("{s}")']
+
+
+def synthetic_entry(i, seed=7):
+    """Entry i of the synthetic corpus as (question, answer, category, language)
+
+    Questions are unique for every i: the mixed-radix digits of a permuted i
+    pick action, modifier, subject and context, and numbers past the
+    combination space get a suffix. About 30% of entries are Tagalog.
+    """
+    rng = random.Random(i * 1000003 + seed)
+    if rng.random() < 0.3:
+        actions, contexts, answers, language = TL_ACTIONS, TL_CONTEXTS, TL_ANSWERS, 'tl'
+    else:
+        actions, contexts, answers, language = EN_ACTIONS, EN_CONTEXTS, EN_ANSWERS, 'en'
+
+    space = len(actions) * len(MODIFIERS) * len(SUBJECTS) * len(contexts)
+    n = (i * 7919) % space if i < space else i
+    n, action = divmod(n, len(actions))
+    n, modifier = divmod(n, len(MODIFIERS))
+    n, subject = divmod(n, len(SUBJECTS))
+    n, context = divmod(n, len(contexts))
+
+    question = f'{actions[action]} {MODIFIERS[modifier]} {SUBJECTS[subject]} {contexts[context]}'
+    if i >= space:
+        question += f' {i // space}'
+    answer = rng.choice(answers).format(s=SUBJECTS[subject])
+    return question, answer, SUBJECTS[subject].split()[0], language
+
+
+def paraphrase(question, rng):
+    """A near-miss query: one word dropped or an extra word added"""
+    words = question.split()
+    if len(words) > 3 and rng.random() < 0.5:
+        del words[rng.randrange(len(words))]
+    else:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(['please', 'pls', 'naman', 'quickly']))
+    return ' '.join(words)
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def pick(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        'n': len(ordered),
+        'mean_ms': sum(ordered) / len(ordered) * 1000,
+        'p50_ms': pick(50),
+        'p90_ms': pick(90),
+        'p99_ms': pick(99),
+        'max_ms': ordered[-1] * 1000
+    }
+
+
+def timed(func, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_size(size, queries, writes, train_repeats):
+    """Benchmark one corpus size in this process; returns {operation: stats}"""
+    import io
+    import contextlib
+    import ai_brain
+
+    class MemoryAI(ai_brain.SmartRobloxAI):
+        def connect_db(self):
+            self.is_connected = False
+            return False
+
+    quiet = contextlib.redirect_stdout(io.StringIO())
+    with quiet:
+        ai = MemoryAI()
+        entries = [synthetic_entry(i) for i in range(size)]
+        ai.memory_storage.extend({'question': q, 'answer': a, 'category': c, 'language': l}
+                                 for q, a, c, l in entries)
+
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        results['train_model'] = timed(lambda: ai.train_model(wait=True), [()] * train_repeats)
+
+    rng = random.Random(size)
+    picks = [entries[rng.randrange(size)][0] for _ in range(queries)]
+    mixed = [(q if n % 2 else paraphrase(q, rng),) for n, q in enumerate(picks)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        results['find_best_match'] = timed(ai.find_best_match, mixed)
+        results['extract_intent'] = timed(ai.extract_intent, mixed)
+        results['get_response'] = timed(ai.get_response, mixed)
+        new_entries = [synthetic_entry(size + n) for n in range(writes)]
+        results['add_training_data'] = timed(ai.add_training_data, new_entries)
+        results['get_stats'] = timed(ai.get_stats, [()] * queries)
+
+    results['peak_rss_mb'] = peak_rss_mb()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Lines describing operations slower than baseline * (1 + tolerance)"""
+    regressions = []
+    for size, operations in results.items():
+        before = baseline.get(size, {})
+        for name, stats in operations.items():
+            if not isinstance(stats, dict) or not isinstance(before.get(name), dict):
+                continue
+            for key in ('p50_ms', 'p90_ms'):
+                old, new = before[name][key], stats[key]
+                if old > 0 and new > old * (1 + tolerance):
+                    regressions.append(f'{size:>8} {name:<18} {key}: {old:.3f} -> {new:.3f} ms '
+                                       f'(+{(new / old - 1) * 100:.0f}%)')
+    return regressions
+
+
+def print_table(results):
+    print(f"{'size':>8} {'operation':<18} {'n':>5} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for size, operations in results.items():
+        for name, stats in operations.items():
+            if isinstance(stats, dict):
+                print(f"{size:>8} {name:<18} {stats['n']:>5} {stats['p50_ms']:>10.3f} "
+                      f"{stats['p90_ms']:>10.3f} {stats['p99_ms']:>10.3f} {stats['max_ms']:>10.3f}")
+        rss = operations.get('peak_rss_mb')
+        if rss is not None:
+            print(f"{size:>8} {'peak RSS':<18} {rss:>28.1f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark SmartRobloxAI in memory storage mode')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='comma separated corpus sizes')
+    parser.add_argument('--queries', type=int, default=200, help='timed calls per read operation')
+    parser.add_argument('--writes', type=int, default=100, help='timed add_training_data calls')
+    parser.add_argument('--train-repeats', type=int, default=3)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="results file to compare against ('' to skip)")
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown (0.2 = 20%%)')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        result = run_size(args.worker, args.queries, args.writes, args.train_repeats)
+        print(json.dumps(result))
+        return 0
+
+    results = {}
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        print(f"⏱️ Benchmarking {size} entries...", file=sys.stderr)
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker', str(size),
+             '--queries', str(args.queries), '--writes', str(args.writes),
+             '--train-repeats', str(args.train_repeats)],
+            stdout=subprocess.PIPE, check=True, text=True)
+        results[str(size)] = json.loads(child.stdout.strip().splitlines()[-1])
+
+    print_table(results)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'queries': args.queries,
+                'writes': args.writes
+            },
+            'results': results
+        }, f, indent=2)
+    print(f"📄 Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions against {args.baseline}:")
+            for line in regressions:
+                print(line)
+            return 1
+        print(f"✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Stream the knowledge base to and from NDJSON files
+
+    python knowledge_cli.py export backup.ndjson [--category C] [--language L]
+    python knowledge_cli.py import backup.ndjson [--restart] [--no-retrain]
+
+One JSON object per line (question, answer, category, language, created_at).
+Both directions work in fixed-size batches, so memory use does not grow
+with the size of the corpus. An interrupted import picks up from its
+progress file on the next run.
+"""
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+
+from ai_brain import BULK_WRITE_BATCH_SIZE, bulk_insert_new, connect_collection
+
+EXPORT_FIELDS = ('question', 'answer', 'category', 'language', 'created_at')
+
+
+def log(message):
+    # stdout may be carrying the export itself
+    print(message, file=sys.stderr)
+
+
+def export_knowledge(collection, out, batch_size, category=None, language=None):
+    """Write matching entries to out in _id order; returns how many were written"""
+    query = {}
+    if category:
+        query['category'] = category
+    if language:
+        query['language'] = language
+    
+    projection = {field: 1 for field in EXPORT_FIELDS}
+    projection['_id'] = 0
+    cursor = collection.find(query, projection).sort('_id', 1).batch_size(batch_size)
+    
+    count = 0
+    for doc in cursor:
+        if isinstance(doc.get('created_at'), datetime):
+            doc['created_at'] = doc['created_at'].isoformat()
+        out.write(json.dumps(doc, ensure_ascii=False) + '\n')
+        count += 1
+        if count % 100000 == 0:
+            log(f"📤 Exported {count} entries...")
+    return count
+
+
+def parse_entry(line):
+    """Knowledge doc from one NDJSON line, or None if it is not a valid entry"""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    question = entry.get('question')
+    answer = entry.get('answer')
+    if not isinstance(question, str) or not question.strip() \
+            or not isinstance(answer, str) or not answer.strip():
+        return None
+    
+    doc = {
+        'question': question.lower().strip(),
+        'answer': answer.strip(),
+        'category': str(entry.get('category') or 'general'),
+        'language': str(entry.get('language') or 'en')
+    }
+    created_at = entry.get('created_at')
+    if isinstance(created_at, str):
+        try:
+            doc['created_at'] = datetime.fromisoformat(created_at)
+        except ValueError:
+            pass
+    return doc
+
+
+class ImportProgress:
+    """Byte offset of the last committed batch, saved next to the input file"""
+    
+    def __init__(self, path, source):
+        self.path = path
+        self.source = os.path.abspath(source)
+        self.offset = 0
+        self.lines = 0
+        self.added = 0
+        self.skipped = 0
+    
+    def load(self):
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if saved.get('source') != self.source:
+            return False
+        self.offset = saved['offset']
+        self.lines = saved['lines']
+        self.added = saved['added']
+        self.skipped = saved['skipped']
+        return True
+    
+    def save(self):
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({
+                'source': self.source,
+                'offset': self.offset,
+                'lines': self.lines,
+                'added': self.added,
+                'skipped': self.skipped
+            }, f)
+        os.replace(tmp, self.path)
+    
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def import_knowledge(collection, path, batch_size, progress):
+    """Bulk-insert the entries of an NDJSON file, committing progress per batch"""
+    with open(path, 'rb') as f:
+        f.seek(progress.offset)
+        batch = {}
+        batch_lines = 0
+        while True:
+            line = f.readline()
+            if line:
+                batch_lines += 1
+                if line.strip():
+                    doc = parse_entry(line.decode('utf-8', errors='replace'))
+                    if doc is None:
+                        log(f"⚠️ Line {progress.lines + batch_lines}: not a valid entry, skipped")
+                    else:
+                        batch.setdefault(doc['question'], doc)
+            
+            if batch_lines and (not line or batch_lines >= batch_size):
+                added = bulk_insert_new(collection, list(batch.values()), batch_size) if batch else 0
+                progress.added += added
+                progress.skipped += batch_lines - added
+                progress.lines += batch_lines
+                progress.offset = f.tell()
+                progress.save()
+                log(f"📥 {progress.lines} lines: {progress.added} new, {progress.skipped} skipped")
+                batch = {}
+                batch_lines = 0
+            
+            if not line:
+                return progress
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import/export the knowledge base as NDJSON')
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    export_cmd = commands.add_parser('export', help='write the knowledge base as NDJSON')
+    export_cmd.add_argument('output', nargs='?', default='-', help="output file ('-' for stdout)")
+    export_cmd.add_argument('--category')
+    export_cmd.add_argument('--language')
+    export_cmd.add_argument('--batch-size', type=int, default=BULK_WRITE_BATCH_SIZE)
+    
+    import_cmd = commands.add_parser('import', help='add the entries of an NDJSON file')
+    import_cmd.add_argument('input')
+    import_cmd.add_argument('--batch-size', type=int, default=BULK_WRITE_BATCH_SIZE)
+    import_cmd.add_argument('--progress', help='progress file (default: <input>.progress)')
+    import_cmd.add_argument('--restart', action='store_true', help='ignore saved progress')
+    import_cmd.add_argument('--no-retrain', action='store_true', help='skip the final retrain')
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        collection = connect_collection()
+    except Exception as e:
+        log(f"❌ MongoDB error: {e}")
+        return 1
+    
+    if args.command == 'export':
+        if args.output == '-':
+            count = export_knowledge(collection, sys.stdout, args.batch_size, args.category, args.language)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as out:
+                count = export_knowledge(collection, out, args.batch_size, args.category, args.language)
+        log(f"✅ Exported {count} entries")
+        return 0
+    
+    progress = ImportProgress(args.progress or f'{args.input}.progress', args.input)
+    if not args.restart and progress.load():
+        log(f"↩️ Resuming after line {progress.lines}")
+    import_knowledge(collection, args.input, args.batch_size, progress)
+    progress.clear()
+    log(f"✅ Imported {progress.added} new entries, {progress.skipped} skipped")
+    
+    if progress.added and not args.no_retrain:
+        # One retrain for the whole import; the new generation reaches running workers
+        from ai_brain import get_ai
+        get_ai().publish_now()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
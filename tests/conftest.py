@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+
+import mongomock
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ai_brain
+
+
+def wait_for(predicate, timeout=5.0):
+    """Poll predicate until it is true; False if it never was within timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def entries(count, prefix='how to thing'):
+    """count knowledge documents: '<prefix> <i> part' -> 'a<i>'"""
+    return [{'question': f'{prefix} {i} part', 'answer': f'a{i}', 'category': 'x', 'language': 'en'}
+            for i in range(count)]
+
+
+class FlakyCollection:
+    """Proxy to a collection whose calls fail like an unreachable server while down is set"""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.down = False
+
+    def __getattr__(self, name):
+        attr = getattr(self.collection, name)
+        if not self.down or not callable(attr):
+            return attr
+
+        def fail(*args, **kwargs):
+            from pymongo.errors import ServerSelectionTimeoutError
+            raise ServerSelectionTimeoutError('server unreachable')
+        return fail
+
+
+@pytest.fixture
+def collection():
+    return mongomock.MongoClient()['roblox_ai_db']['knowledge']
+
+
+@pytest.fixture
+def make_ai(tmp_path, monkeypatch, collection):
+    """Factory for SmartRobloxAI instances on a mongomock collection, with private
+    artifact and journal directories and short background delays"""
+    monkeypatch.setattr(ai_brain, 'ARTIFACT_DIR', str(tmp_path / 'model_artifacts'))
+    monkeypatch.setattr(ai_brain, 'JOURNAL_DIR', str(tmp_path / 'write_journal'))
+    monkeypatch.setattr(ai_brain, 'RETRAIN_DEBOUNCE', 0.05)
+    monkeypatch.setattr(ai_brain, 'SHARED_INDEX_POLL', 0.0)
+    monkeypatch.setattr(ai_brain, 'SHARED_INDEX_PUBLISH_DELAY', 0.05)
+    monkeypatch.setattr(ai_brain, 'JOURNAL_FLUSH_INTERVAL', 0.01)
+
+    def make(target=None):
+        return ai_brain.SmartRobloxAI(collection=collection if target is None else target)
+    return make
+
+
+@pytest.fixture
+def client(make_ai, monkeypatch):
+    """Flask test client of app.py, served by a make_ai() instance (ai_brain.get_ai())"""
+    import app
+    monkeypatch.setattr(ai_brain, '_ai_instance', make_ai())
+    return app.app.test_client()
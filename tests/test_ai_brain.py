@@ -0,0 +1,16 @@
+from conftest import FlakyCollection
+
+
+def test_reads_are_served_from_the_snapshot_without_mongodb(make_ai, collection):
+    flaky = FlakyCollection(collection)
+    ai = make_ai(flaky)
+    # Any MongoDB call from here on fails and is counted by the breaker
+    flaky.down = True
+
+    assert ai.get_response('hi')['source'] == 'exact_match'
+    ai.get_response('how do i make a part')
+    ai.get_responses(['hello', 'thanks'])
+    stats = ai.get_stats()
+
+    assert stats['training_examples'] == ai.knowledge_size
+    assert stats['mongodb']['consecutive_failures'] == 0
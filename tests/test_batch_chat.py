@@ -0,0 +1,41 @@
+import app
+
+
+QUESTIONS = ['hi', 'how do i make a part', 'how to use a remote event', 'kamusta', 'what is the meaning of zorp']
+
+
+def test_batch_answers_match_single_answers(make_ai):
+    single = make_ai()
+    batch = make_ai()
+    # Without the response cache both paths score every question themselves
+    single.response_cache.maxsize = batch.response_cache.maxsize = 0
+
+    expected = [single.get_response(q) for q in QUESTIONS]
+    results = batch.get_responses(QUESTIONS)
+
+    fields = ('answer', 'source', 'found')
+    assert [tuple(r.get(f) for f in fields) for r in results] == \
+        [tuple(r.get(f) for f in fields) for r in expected]
+    for result, reference in zip(results, expected):
+        assert abs(result.get('confidence', 0.0) - reference.get('confidence', 0.0)) < 1e-6
+
+
+def test_batch_route_answers_in_order(client):
+    response = client.post('/chat/batch', json={'questions': ['hi', '  thanks  ']})
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert [r['source'] for r in body['responses']] == ['exact_match', 'exact_match']
+    assert body['responses'][0]['response'] == client.post('/chat', json={'question': 'hi'}).get_json()['response']
+    assert body['knowledge_count'] > 0
+
+
+def test_batch_route_rejects_bad_input(client, monkeypatch):
+    monkeypatch.setattr(app, 'MAX_BATCH_QUESTIONS', 2)
+
+    assert client.post('/chat/batch', json={}).status_code == 400
+    assert client.post('/chat/batch', json={'questions': []}).status_code == 400
+    assert client.post('/chat/batch', json={'questions': 'hi'}).status_code == 400
+    assert client.post('/chat/batch', json={'questions': ['a', 'b', 'c']}).status_code == 400
+    assert client.post('/chat/batch', json={'questions': ['hi', 3]}).status_code == 400
+    assert client.post('/chat/batch', json={'questions': ['hi', ' ']}).status_code == 400
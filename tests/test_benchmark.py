@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+import ai_brain
+
+
+@pytest.fixture
+def benchmark(monkeypatch):
+    """The benchmark module; the environment it sets on import is restored afterwards"""
+    monkeypatch.setenv('AI_ARTIFACT_DIR', '')
+    monkeypatch.setenv('AI_RESPONSE_CACHE_SIZE', '0')
+    monkeypatch.setattr(ai_brain, 'ARTIFACT_DIR', '')
+    import benchmark
+    return benchmark
+
+
+def test_synthetic_entries_are_unique_and_reproducible(benchmark):
+    corpus = [benchmark.synthetic_entry(i) for i in range(3000)]
+
+    assert len({question for question, _, _, _ in corpus}) == len(corpus)
+    assert corpus[42] == benchmark.synthetic_entry(42)
+    assert 0.2 < sum(language == 'tl' for _, _, _, language in corpus) / len(corpus) < 0.4
+
+
+def test_compare_reports_only_slowdowns_past_the_tolerance(benchmark):
+    def stats(p50, p90):
+        return {'n': 1, 'p50_ms': p50, 'p90_ms': p90}
+
+    baseline = {'1000': {'get_response': stats(1.0, 2.0), 'get_stats': stats(1.0, 1.0), 'peak_rss_mb': 50}}
+    results = {'1000': {'get_response': stats(1.1, 3.0), 'get_stats': stats(0.5, 0.5), 'peak_rss_mb': 90},
+               '5000': {'get_response': stats(9.0, 9.0)}}
+
+    regressions = benchmark.compare(results, baseline, 0.2)
+
+    assert len(regressions) == 1
+    assert 'get_response' in regressions[0] and 'p90_ms' in regressions[0]
+
+
+def test_committed_baseline_covers_every_operation(benchmark):
+    with open(benchmark.DEFAULT_BASELINE) as f:
+        baseline = json.load(f)['results']
+
+    results = benchmark.run_size(200, 5, 5, 1)
+
+    assert set(baseline) == set(benchmark.DEFAULT_SIZES.split(','))
+    for operations in baseline.values():
+        assert set(operations) == set(results)
+    assert results['get_response']['n'] == 5
@@ -0,0 +1,72 @@
+import time
+
+import ai_brain
+from ai_brain import bulk_insert_new
+from conftest import wait_for
+
+
+def test_bulk_train_stores_new_entries_and_skips_known_ones(client, collection):
+    ai = ai_brain.get_ai()
+    size = ai.knowledge_size
+
+    response = client.post('/bulk-train', json={'entries': [
+        {'question': 'Bulk One', 'answer': 'first', 'category': 'bulk'},
+        {'question': 'bulk two', 'answer': 'second', 'language': 'en'},
+        {'question': 'hi', 'answer': 'already known'}
+    ]})
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert (body['success_count'], body['failed_count']) == (2, 1)
+    assert body['total_knowledge'] == size + 2
+    # Stored right away, or by the journal flusher in write-behind mode
+    assert wait_for(lambda: collection.find_one({'question': 'bulk one'}) is not None)
+    assert collection.find_one({'question': 'bulk one'})['category'] == 'bulk'
+    assert ai.get_response('bulk two')['answer'] == 'second'
+
+
+def test_bulk_train_rejects_the_whole_payload_when_an_entry_is_invalid(client, collection):
+    count = collection.count_documents({})
+
+    response = client.post('/bulk-train', json={'entries': [
+        {'question': 'valid question', 'answer': 'valid answer'},
+        {'question': 'no answer'},
+        'not an object'
+    ]})
+
+    body = response.get_json()
+    assert response.status_code == 400
+    assert body['details'] == ['entry 1: question and answer are required', 'entry 2: must be an object']
+    assert collection.count_documents({}) == count
+
+
+def test_bulk_train_needs_a_list_of_entries(client):
+    assert client.post('/bulk-train', json={}).status_code == 400
+    assert client.post('/bulk-train', json={'entries': []}).status_code == 400
+
+
+def test_bulk_insert_writes_in_batches_and_leaves_stored_entries_alone(collection, monkeypatch):
+    collection.insert_one({'question': 'bulk question 1', 'answer': 'kept'})
+    calls = []
+    bulk_write = collection.bulk_write
+    monkeypatch.setattr(collection, 'bulk_write',
+                        lambda ops, **kwargs: calls.append(len(ops)) or bulk_write(ops, **kwargs))
+
+    added = bulk_insert_new(collection, [{'question': f'bulk question {i}', 'answer': f'answer {i}'}
+                                         for i in range(5)], batch_size=2)
+
+    assert added == 4
+    assert calls == [2, 2, 1]
+    assert collection.find_one({'question': 'bulk question 1'})['answer'] == 'kept'
+
+
+def test_bulk_add_is_followed_by_a_single_rebuild(make_ai):
+    ai = make_ai()
+    rebuilds = ai.rebuilds
+
+    ai.add_training_data_bulk([(f'bulk question {i}', f'answer {i}', 'bulk', 'en') for i in range(5)])
+
+    assert wait_for(lambda: ai.rebuilds > rebuilds and len(ai._overlay) == 0)
+    time.sleep(0.2)
+    assert ai.rebuilds == rebuilds + 1
+    assert ai.get_response('bulk question 3')['answer'] == 'answer 3'
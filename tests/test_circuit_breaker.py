@@ -0,0 +1,115 @@
+import pytest
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+
+import ai_brain
+from ai_brain import CircuitBreaker, StorageUnavailable
+from conftest import FlakyCollection, wait_for
+
+
+def test_breaker_opens_after_failures_and_closes_after_a_trial():
+    breaker = CircuitBreaker(failures=2, reset_after=0.05)
+    outage = ServerSelectionTimeoutError('down')
+
+    breaker.record(outage)
+    assert breaker.closed and breaker.allow()
+    breaker.record(outage)
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+    assert wait_for(breaker.allow)
+    assert breaker.state == 'half_open'
+    # Only one trial call at a time
+    assert not breaker.allow()
+    breaker.record(outage)
+    assert breaker.state == 'open'
+
+    assert wait_for(breaker.allow)
+    breaker.record()
+    assert breaker.closed and breaker.allow()
+    assert breaker.opens == 1
+
+
+def test_breaker_ignores_errors_that_are_not_outages():
+    breaker = CircuitBreaker(failures=1, reset_after=60)
+
+    breaker.record(DuplicateKeyError('duplicate'))
+
+    assert breaker.closed
+
+
+def test_outage_queues_writes_and_flushes_them_on_recovery(make_ai, collection):
+    flaky = FlakyCollection(collection)
+    ai = make_ai(flaky)
+    ai.breaker = CircuitBreaker(failures=1, reset_after=0.1)
+    size = ai.knowledge_size
+
+    flaky.down = True
+    ai.get_knowledge_count()
+    assert ai.breaker.state == 'open'
+    assert ai.get_response('hi')['source'] == 'exact_match'
+    assert ai.add_training_data('outage question', 'queued answer')
+    assert ai.delete_knowledge('thanks')
+    assert ai.get_response('outage question')['answer'] == 'queued answer'
+    assert ai.journal.pending_count == 2
+    # A rebuild keeps the current snapshot instead of an empty corpus
+    ai.train_model(wait=True)
+    assert ai.knowledge_size == size
+
+    flaky.down = False
+
+    assert wait_for(lambda: ai.journal.pending_count == 0)
+    assert ai.breaker.closed
+    assert collection.find_one({'question': 'outage question'})['answer'] == 'queued answer'
+    assert collection.find_one({'question': 'thanks'}) is None
+
+
+def test_outage_without_journal_refuses_writes(make_ai, collection, monkeypatch):
+    monkeypatch.setattr(ai_brain, 'JOURNAL_DIR', '')
+    flaky = FlakyCollection(collection)
+    ai = make_ai(flaky)
+    ai.breaker = CircuitBreaker(failures=1, reset_after=60)
+    flaky.down = True
+
+    with pytest.raises(StorageUnavailable):
+        ai.add_training_data('lost question', 'lost answer')
+    with pytest.raises(StorageUnavailable):
+        ai.add_training_data_bulk([('lost bulk', 'lost answer', 'x', 'en')])
+    with pytest.raises(StorageUnavailable):
+        ai.delete_knowledge('hi')
+    assert len(ai.memory_storage) == 0
+
+
+class CountingFlakyCollection(FlakyCollection):
+    """FlakyCollection that counts the calls it fails"""
+
+    def __init__(self, collection):
+        super().__init__(collection)
+        self.failed_calls = 0
+
+    def __getattr__(self, name):
+        attr = super().__getattr__(name)
+        if self.down and callable(attr):
+            self.failed_calls += 1
+        return attr
+
+
+def test_open_circuit_keeps_requests_away_from_mongodb(client, make_ai, collection, monkeypatch):
+    flaky = CountingFlakyCollection(collection)
+    ai = make_ai(flaky)
+    ai.breaker = CircuitBreaker(failures=2, reset_after=60)
+    monkeypatch.setattr(ai_brain, '_ai_instance', ai)
+    flaky.down = True
+    ai.get_knowledge_count()
+    ai.get_knowledge_count()
+    failed = flaky.failed_calls
+
+    for _ in range(5):
+        assert client.post('/chat', json={'question': 'hi'}).get_json()['source'] == 'exact_match'
+    stats = client.get('/stats').get_json()
+
+    assert flaky.failed_calls == failed
+    assert stats['mongodb']['state'] == 'open'
+    assert stats['mongodb']['opens'] == 1
+    assert stats['mongodb']['retry_in'] > 0
+    assert 'server unreachable' in stats['mongodb']['last_error']
+    assert stats['training_examples'] == ai.knowledge_size
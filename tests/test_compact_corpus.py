@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from ai_brain import CompactCorpus
+
+
+DOCS = [
+    {'_id': ObjectId(), 'question': 'how to make a part', 'answer': 'Instance.new', 'category': 'parts',
+     'language': 'en', 'created_at': datetime(2024, 5, 6, 7, 8, 9, 123456)},
+    {'_id': 'custom-id', 'question': 'kamusta', 'answer': 'mabuti', 'category': 'greeting', 'language': 'tl'},
+    {'question': 'what is a part', 'answer': 'Instance.new', 'category': 'parts', 'language': 'en',
+     'created_at': '2024-01-02T03:04:05'},
+    {'question': 'no category', 'answer': 'x'}
+]
+
+
+def test_rows_read_back_like_the_documents():
+    corpus = CompactCorpus(DOCS)
+
+    assert dict(corpus[0]) == DOCS[0]
+    assert dict(corpus[1]) == DOCS[1]
+    assert corpus[2]['created_at'] == datetime(2024, 1, 2, 3, 4, 5)
+    assert dict(corpus[3]) == DOCS[3]
+    assert 'category' not in corpus[3]
+    assert corpus[-1]['question'] == 'no category'
+    # Repeated values are held once
+    assert corpus.answers.values == ['Instance.new', 'mabuti', 'x']
+
+
+def test_deleted_rows_read_as_none_and_leave_the_counts():
+    corpus = CompactCorpus(DOCS)
+
+    corpus[0] = None
+
+    assert corpus[0] is None
+    assert [item['question'] if item else None for item in corpus] == \
+        [None, 'kamusta', 'what is a part', 'no category']
+    assert corpus.value_counts('category', 'general') == {'greeting': 1, 'parts': 1, 'general': 1}
+    assert corpus.value_counts('language', 'en') == {'tl': 1, 'en': 2}
+
+
+def test_filters_are_masks_over_live_rows():
+    corpus = CompactCorpus(DOCS)
+    corpus[2] = None
+
+    assert corpus.filter_rows(category='parts').tolist() == [0]
+    assert corpus.filter_rows(language='en').tolist() == [0]
+    assert corpus.filter_rows(start=1).tolist() == [1, 3]
+    assert corpus.filter_rows(category='missing').tolist() == []
+    assert corpus.column('category', 'general') == ['parts', 'greeting', 'parts', 'general']
+
+
+def test_copies_are_independent():
+    corpus = CompactCorpus(DOCS)
+    copy = corpus.copy()
+
+    copy.append({'question': 'copy only', 'answer': 'new answer', 'category': 'new', 'language': 'en'})
+    copy[1] = {'question': 'kamusta', 'answer': 'ayos lang', 'category': 'greeting', 'language': 'tl'}
+    corpus[0] = None
+
+    assert len(corpus) == 4 and len(copy) == 5
+    assert corpus[1]['answer'] == 'mabuti' and copy[1]['answer'] == 'ayos lang'
+    assert copy[0]['_id'] == DOCS[0]['_id']
+    assert 'new answer' not in corpus.answers.values
@@ -0,0 +1,52 @@
+import numpy as np
+
+import ai_brain
+from ai_brain import HashingIndex, INDEX_ENGINES
+
+
+QUESTIONS = ['how to make a part', 'how to make a gui', 'what is a tween']
+
+
+def test_appended_rows_match_rows_hashed_at_fit(monkeypatch):
+    monkeypatch.setattr(ai_brain, 'HASHING_IDF', False)
+    grown = HashingIndex()
+    grown.fit(QUESTIONS)
+    fresh = HashingIndex()
+    fresh.fit(QUESTIONS + ['spaceship rockets go brr'])
+
+    # Words no fit has seen are still indexed, and nothing asks for a refit
+    assert grown.append('spaceship rockets go brr')
+    assert not grown.needs_refit
+
+    assert (grown.matrix() != fresh.matrix()).nnz == 0
+    assert grown.top_k('spaceship rockets', 1)[0][0] == 3
+
+
+def test_idf_weights_are_refreshed_once_enough_rows_were_appended(monkeypatch):
+    monkeypatch.setattr(ai_brain, 'HASHING_IDF', True)
+    index = HashingIndex(drift_threshold=0.2)
+    index.fit(QUESTIONS * 2)
+    idf = index.idf.copy()
+
+    assert index.append('how to make a door')
+    assert index.drift == 1 / 7
+    assert not index.append('how to make a window')
+    assert index.needs_refit
+    assert np.array_equal(index.idf, idf)
+
+    index.fit(QUESTIONS * 2 + ['how to make a door', 'how to make a window'])
+    assert not index.needs_refit
+    assert not np.array_equal(index.idf, idf)
+
+
+def test_ai_answers_on_the_hashing_engine(make_ai, monkeypatch):
+    monkeypatch.setitem(INDEX_ENGINES, 'tfidf', HashingIndex)
+    monkeypatch.setattr(ai_brain, 'HASHING_IDF', False)
+    ai = make_ai()
+    assert isinstance(ai.snapshot.index.partitions['en'], HashingIndex)
+
+    ai.add_training_data('completely unrelated words about spaceships', 'rockets')
+
+    assert not ai.snapshot.index.needs_refit
+    assert ai.find_best_match('unrelated words about spaceships')['answer'] == 'rockets'
+    assert ai.rebuilds == 1
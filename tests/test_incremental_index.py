@@ -0,0 +1,43 @@
+from ai_brain import TfidfIndex
+from conftest import wait_for
+
+
+def test_teach_is_answered_without_a_retrain(make_ai):
+    ai = make_ai()
+    assert ai.get_response('brand new question')['source'] != 'exact_match'
+
+    assert ai.add_training_data('brand new question', 'brand new answer')
+
+    result = ai.get_response('brand new question')
+    assert (result['answer'], result['source']) == ('brand new answer', 'exact_match')
+    assert ai.rebuilds == 1
+
+
+def test_appended_rows_are_scored_against_the_fitted_vocabulary():
+    index = TfidfIndex(drift_threshold=1.0)
+    index.fit(['how to make a part', 'how to make a gui', 'what is a tween'])
+
+    assert index.append('what is a part')
+
+    assert index.size == 4
+    assert index.top_k('what is a part', 1)[0][0] == 3
+
+
+def test_drift_past_the_threshold_asks_for_a_refit():
+    index = TfidfIndex(drift_threshold=0.2)
+    index.fit(['how to make a part', 'how to make a gui'])
+
+    assert index.append('how to make a part')
+    assert index.drift == 0
+    assert not index.append('completely unrelated words here')
+    assert index.needs_refit
+
+
+def test_drifted_partition_is_refitted_in_the_background(make_ai):
+    ai = make_ai()
+
+    ai.add_training_data('completely unrelated words about spaceships', 'rockets')
+
+    assert wait_for(lambda: ai.rebuilds == 2 and not ai.snapshot.index.needs_refit)
+    assert 'spaceships' in ai.snapshot.index.partitions['en'].vectorizer.vocabulary_
+    assert ai.get_response('completely unrelated words about spaceships')['answer'] == 'rockets'
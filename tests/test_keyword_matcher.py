@@ -0,0 +1,51 @@
+import random
+
+from ai_brain import KeywordMatcher
+
+
+def naive_find(keyword_tags, text):
+    return {tag for keyword, tags in keyword_tags.items() if keyword in text for tag in tags}
+
+
+def test_find_matches_a_substring_check_per_keyword():
+    keyword_tags = {'local': {'a'}, 'localplayer': {'b'}, 'player': {'c'}, 'lay': {'d'},
+                    'for': {'e'}, 'format': {'f'}, 'or': {'g'}, 'a': {'h'}}
+    matcher = KeywordMatcher(keyword_tags)
+    fragments = list(keyword_tags) + ['x', ' ', 'loc', 'play', 'orm']
+    rng = random.Random(12)
+
+    for _ in range(500):
+        text = ''.join(rng.choice(fragments) for _ in range(rng.randint(0, 6)))
+        assert matcher.find(text) == naive_find(keyword_tags, text), text
+
+
+def test_classify_finds_intent_topics_and_language_in_one_pass(make_ai):
+    ai = make_ai()
+
+    result = ai.classify('How do I tween the LocalPlayer to a part?')
+
+    assert result['type'] == 'how_to'
+    assert set(result['topics']) == {'tween', 'player', 'variable', 'part'}
+    assert result['language'] == 'en'
+    # Intent phrases are checked in priority order: how_to before definition
+    assert ai.classify('how to know what is a gui')['type'] == 'how_to'
+    assert ai.classify('paano gumawa ng part sa roblox')['language'] == 'tl'
+
+
+def test_classify_agrees_with_the_keyword_tables(make_ai):
+    ai = make_ai()
+    questions = ['what is a remote event', 'bakit hindi gumagana ang loop ko', 'show me a table example',
+                 'can i damage a humanoid', 'teleport player to cframe position', 'hello there']
+
+    for question in questions:
+        q = question.lower()
+        intent = next((name for name, phrases in ai.intent_phrases if any(p in q for p in phrases)), 'general')
+        topics = [topic for topic, keywords in ai.topic_keywords.items() if any(k in q for k in keywords)]
+        words = q.split()
+        tagalog = sum(word in ai.tagalog_words for word in words)
+        english = sum(word in ai.english_stopwords for word in words)
+
+        result = ai.classify(question)
+        assert (result['type'], result['topics']) == (intent, topics), question
+        assert result['language_counts'] == {'tl': tagalog, 'en': english}
+        assert result['language'] == ('tl' if tagalog > english else 'en')
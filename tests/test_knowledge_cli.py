@@ -0,0 +1,99 @@
+import io
+import json
+from datetime import datetime
+
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+import knowledge_cli
+from knowledge_cli import ImportProgress, export_knowledge, import_knowledge
+
+
+class FailingBulkWrites:
+    """Collection proxy whose bulk_write fails once calls have been made"""
+
+    def __init__(self, collection, calls):
+        self.collection = collection
+        self.calls = calls
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def bulk_write(self, ops, **kwargs):
+        if self.calls <= 0:
+            raise ServerSelectionTimeoutError('server unreachable')
+        self.calls -= 1
+        return self.collection.bulk_write(ops, **kwargs)
+
+
+def write_lines(path, lines):
+    path.write_text(''.join(line + '\n' for line in lines), encoding='utf-8')
+
+
+def test_interrupted_import_resumes_without_duplicates(tmp_path, collection):
+    collection.insert_one({'question': 'q 3', 'answer': 'already here', 'category': 'x', 'language': 'en'})
+    source = tmp_path / 'knowledge.ndjson'
+    lines = [json.dumps({'question': f'Q {i}', 'answer': f'a{i}'}) for i in range(10)]
+    write_lines(source, lines[:5] + ['not json', '{"question": "no answer"}', ''] + lines[5:])
+    progress_path = str(tmp_path / 'knowledge.progress')
+
+    # The third batch never reaches the server
+    progress = ImportProgress(progress_path, str(source))
+    with pytest.raises(ServerSelectionTimeoutError):
+        import_knowledge(FailingBulkWrites(collection, 2), str(source), 3, progress)
+
+    resumed = ImportProgress(progress_path, str(source))
+    assert resumed.load()
+    assert resumed.lines == 6
+    import_knowledge(collection, str(source), 3, resumed)
+
+    questions = [doc['question'] for doc in collection.find()]
+    assert sorted(questions) == sorted(f'q {i}' for i in range(10))
+    assert collection.find_one({'question': 'q 3'})['answer'] == 'already here'
+    assert (resumed.lines, resumed.added) == (13, 9)
+    assert resumed.skipped == 4
+
+
+def test_progress_of_another_file_is_ignored(tmp_path):
+    progress = ImportProgress(str(tmp_path / 'p'), str(tmp_path / 'one.ndjson'))
+    progress.offset = 10
+    progress.save()
+
+    assert not ImportProgress(str(tmp_path / 'p'), str(tmp_path / 'two.ndjson')).load()
+
+
+def test_export_round_trips_through_import(tmp_path, collection):
+    created = datetime(2024, 5, 6, 7, 8, 9)
+    collection.insert_many([
+        {'question': 'how to make a part', 'answer': 'Instance.new', 'category': 'parts', 'language': 'en',
+         'created_at': created},
+        {'question': 'kamusta', 'answer': 'mabuti', 'category': 'greeting', 'language': 'tl',
+         'created_at': created}
+    ])
+    out = io.StringIO()
+
+    assert export_knowledge(collection, out, 1) == 2
+    assert export_knowledge(collection, io.StringIO(), 1, language='tl') == 1
+
+    exported = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert exported[0] == {'question': 'how to make a part', 'answer': 'Instance.new', 'category': 'parts',
+                           'language': 'en', 'created_at': created.isoformat()}
+
+    source = tmp_path / 'backup.ndjson'
+    source.write_text(out.getvalue(), encoding='utf-8')
+    target = collection.database['restored']
+    import_knowledge(target, str(source), 10, ImportProgress(str(tmp_path / 'p'), str(source)))
+
+    restored = sorted(target.find({}, {'_id': 0}), key=lambda doc: doc['question'])
+    assert restored == sorted(collection.find({}, {'_id': 0}), key=lambda doc: doc['question'])
+
+
+def test_cli_import_clears_its_progress(tmp_path, collection, monkeypatch):
+    monkeypatch.setattr(knowledge_cli, 'connect_collection', lambda: collection)
+    source = tmp_path / 'knowledge.ndjson'
+    write_lines(source, [json.dumps({'question': 'cli question', 'answer': 'cli answer'})])
+
+    assert knowledge_cli.main(['import', str(source), '--no-retrain']) == 0
+
+    assert collection.find_one({'question': 'cli question'})['answer'] == 'cli answer'
+    assert not (tmp_path / 'knowledge.ndjson.progress').exists()
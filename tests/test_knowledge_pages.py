@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+import ai_brain
+from conftest import entries
+
+
+def test_all_digit_object_id_cursor_reads_from_mongodb(make_ai, collection):
+    collection.insert_one({'_id': ObjectId('000000000000000000000001'), 'question': 'first', 'answer': 'a'})
+    collection.insert_many(entries(3))
+    ai = make_ai()
+
+    page = list(ai.iter_knowledge(after='000000000000000000000001', limit=100))
+
+    assert len(page) == collection.count_documents({}) - 1
+    assert all(not cursor.startswith('r:') for cursor, _ in page)
+
+
+def test_snapshot_pages_use_row_cursors(make_ai, collection):
+    ai = make_ai()
+    ai.is_connected = False
+
+    first = list(ai.iter_knowledge(limit=3))
+    second = list(ai.iter_knowledge(after=first[-1][0], limit=3))
+
+    assert [cursor for cursor, _ in first] == ['r:0', 'r:1', 'r:2']
+    assert [cursor for cursor, _ in second] == ['r:3', 'r:4', 'r:5']
+    with pytest.raises(ValueError):
+        list(ai.iter_knowledge(after='12'))
+
+
+def test_knowledge_route_pages_through_every_entry(client, collection):
+    collection.insert_many(entries(7))
+    total = collection.count_documents({})
+
+    seen = []
+    after = ''
+    while after is not None:
+        body = client.get(f'/knowledge?limit=3&after={after}').get_json()
+        assert body['count'] == len(body['knowledge']) <= 3
+        seen += [entry['_id'] for entry in body['knowledge']]
+        after = body['next_cursor']
+
+    assert len(seen) == len(set(seen)) == total
+    assert seen == [str(doc['_id']) for doc in collection.find().sort('_id', 1)]
+
+
+def test_knowledge_route_returns_the_requested_fields(client, collection):
+    created = datetime(2024, 5, 6, 7, 8, 9)
+    collection.insert_one({'question': 'dated question', 'answer': 'd', 'category': 'dated', 'language': 'en',
+                           'created_at': created})
+
+    body = client.get('/knowledge?category=dated&fields=question,created_at').get_json()
+    streamed = client.get('/knowledge?category=dated&fields=question,created_at&stream=1').get_json()
+
+    entry = body['knowledge'][0]
+    assert set(entry) == {'_id', 'question', 'created_at'}
+    assert entry['created_at'] == created.isoformat()
+    assert streamed == body
+    # Snapshot pages format it the same way
+    ai_brain.get_ai().train_model(wait=True)
+    ai_brain.get_ai().is_connected = False
+    assert client.get('/knowledge?category=dated').get_json()['knowledge'][0]['created_at'] == created.isoformat()
+
+
+def test_knowledge_route_rejects_bad_parameters(client):
+    assert client.get('/knowledge?limit=0').status_code == 400
+    assert client.get('/knowledge?limit=ten').status_code == 400
+    assert client.get('/knowledge?limit=100000').status_code == 400
+    assert client.get('/knowledge?fields=question,secret').status_code == 400
+    assert client.get('/knowledge?after=not-a-cursor').status_code == 400
@@ -0,0 +1,54 @@
+import ai_brain
+
+
+def test_each_language_gets_its_own_partition(make_ai):
+    ai = make_ai()
+    index = ai.snapshot.index
+    corpus = ai.snapshot.corpus
+
+    assert set(index.languages()) == {'en', 'tl'}
+    for language, partition in index.partitions.items():
+        assert {corpus[row]['language'] for row in partition.row_ids.tolist()} == {language}
+    # Tagalog words stay out of the English vocabulary
+    assert 'kamusta' not in index.partitions['en'].vectorizer.vocabulary_
+    assert 'kamusta' in index.partitions['tl'].vectorizer.vocabulary_
+
+
+def test_questions_are_routed_to_their_language(make_ai):
+    ai = make_ai()
+    ai.add_training_data('paano gumawa ng espada', 'gamitin ang tool', 'x', 'tl')
+    ai.add_training_data('how to make a sword espada', 'use a tool', 'x', 'en')
+    ai.train_model(wait=True)
+
+    matches = ai.find_top_matches('paano gumawa ng espada sa laro', 3)
+
+    assert matches[0]['answer'] == 'gamitin ang tool'
+    assert {match['language'] for match in matches} == {'tl'}
+
+
+def test_fallback_searches_the_other_partitions(make_ai, monkeypatch):
+    ai = make_ai()
+    ai.add_training_data('espada roblox', 'gamitin ang tool', 'x', 'tl')
+    ai.train_model(wait=True)
+    # Detected as English, but only the Tagalog partition knows the words
+    question = 'espada roblox now'
+    assert ai.detect_language(question) == 'en'
+
+    assert ai.find_top_matches(question, 1)[0]['language'] == 'tl'
+    assert ai.get_responses([question])[0]['answer'] == 'gamitin ang tool'
+
+    monkeypatch.setattr(ai_brain, 'LANGUAGE_FALLBACK', False)
+    assert ai.find_top_matches(question, 1) == []
+    assert ai.get_response(question + ' now')['answer'] != 'gamitin ang tool'
+
+
+def test_language_thresholds_override_the_defaults(make_ai, monkeypatch):
+    monkeypatch.setattr(ai_brain, 'LANGUAGE_THRESHOLDS', {'tl': {'match': 0.9, 'answer': 0.95}})
+    ai = make_ai()
+    ai.add_training_data('paano gumawa ng espada', 'gamitin ang tool', 'x', 'tl')
+    ai.train_model(wait=True)
+
+    assert ai._thresholds('tl') == (0.9, 0.95)
+    assert ai._thresholds('en') == (ai.match_threshold, ai.answer_threshold)
+    assert ai.find_top_matches('gumawa ng espada', 3) == []
+    assert ai.find_top_matches('paano gumawa ng espada sa laro', 3)[0]['confidence'] > 0.95
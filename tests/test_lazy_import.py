@@ -0,0 +1,14 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_the_app_builds_no_ai_instance():
+    code = 'import ai_brain, app; assert ai_brain._ai_instance is None; print(repr(app.ai))'
+
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '<SmartRobloxAI (not loaded)>'
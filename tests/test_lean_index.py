@@ -0,0 +1,63 @@
+import numpy as np
+
+import ai_brain
+from ai_brain import SortedVocabulary, TfidfIndex
+
+
+QUESTIONS = ['how to make a part', 'how to make a gui', 'what is a tween', 'how do i tween a part',
+             'paano gumawa ng part', 'what is a remote event', 'how to fire a remote event']
+
+
+def test_memory_bytes_uses_the_vocabulary_size_measured_at_fit(make_ai):
+    ai = make_ai()
+    index = ai.snapshot.index.partitions['en']
+
+    assert index.vocabulary_bytes == index._measure_vocabulary() > 0
+    assert index.memory_bytes() > index.vocabulary_bytes
+
+
+def test_sorted_vocabulary_maps_terms_like_the_dict():
+    index = TfidfIndex()
+    index.fit(QUESTIONS)
+    vocabulary = index.vectorizer.vocabulary_
+
+    compact = SortedVocabulary(vocabulary)
+
+    assert dict(compact) == vocabulary
+    assert 'not a term' not in compact
+    assert compact.memory_bytes() < index._measure_vocabulary()
+
+
+def test_lean_index_scores_like_the_default_one(monkeypatch):
+    full = TfidfIndex()
+    full.fit(QUESTIONS)
+    monkeypatch.setattr(ai_brain, 'LEAN_INDEX', True)
+    lean = TfidfIndex()
+    lean.fit(QUESTIONS)
+
+    assert lean.vectors.dtype == np.float32 and lean.vectors.indices.dtype == np.int32
+    assert isinstance(lean.vectorizer.vocabulary_, SortedVocabulary)
+    assert lean.vectorizer.stop_words_ is None
+    assert lean.memory_bytes() < full.memory_bytes()
+    for question in ('how to make a part move', 'what is a remote', 'paano gumawa'):
+        expected = full.top_k(question, 3)
+        results = lean.top_k(question, 3)
+        assert [row for row, _ in results] == [row for row, _ in expected]
+        assert np.allclose([score for _, score in results], [score for _, score in expected], atol=1e-6)
+
+
+def test_pruned_rows_stay_normalised(monkeypatch):
+    monkeypatch.setattr(ai_brain, 'INDEX_PRUNE', 0.2)
+    index = TfidfIndex()
+    index.fit(QUESTIONS)
+
+    matrix = index.matrix()
+    assert matrix.data.min() >= 0.2
+    assert np.allclose(np.sqrt(matrix.multiply(matrix).sum(axis=1)), 1)
+
+
+def test_stats_report_the_index_footprint(client):
+    memory = client.get('/stats').get_json()['index_memory']
+
+    assert memory['bytes'] == sum(memory['partitions'].values()) > 0
+    assert set(memory['partitions']) == {'en', 'tl'}
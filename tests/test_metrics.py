@@ -0,0 +1,54 @@
+import pytest
+
+import ai_brain
+from ai_brain import Histogram, Metrics
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """A fresh, enabled process registry"""
+    registry = Metrics(enabled=True)
+    monkeypatch.setattr(ai_brain, 'METRICS', registry)
+    return registry
+
+
+def test_histogram_buckets_are_cumulative_when_rendered():
+    histogram = Histogram((0.1, 0.5))
+    for value in (0.05, 0.1, 0.3, 0.9):
+        histogram.observe(value)
+
+    assert histogram.render('x', 'stage', 's') == [
+        'x_bucket{stage="s",le="0.1"} 2',
+        'x_bucket{stage="s",le="0.5"} 3',
+        'x_bucket{stage="s",le="+Inf"} 4',
+        'x_sum{stage="s"} 1.35',
+        'x_count{stage="s"} 4'
+    ]
+
+
+def test_disabled_metrics_record_nothing():
+    registry = Metrics(enabled=False)
+
+    with registry.stage('exact_match'):
+        pass
+    registry.record_response({'source': 'exact_match', 'confidence': 1.0})
+
+    assert (registry.stages, registry.sources, registry.confidence) == ({}, {}, {})
+
+
+def test_metrics_route_reports_stages_sources_and_gauges(client, metrics):
+    client.post('/chat', json={'question': 'hi'})
+    client.post('/chat', json={'question': 'hi'})
+    client.post('/chat', json={'question': 'how do i make a part glow'})
+
+    response = client.get('/metrics')
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert response.mimetype == 'text/plain'
+    assert 'ai_responses_total{source="exact_match"} 2' in lines
+    assert sum(metrics.sources.values()) == 3
+    for stage in ('get_response', 'cache_lookup', 'exact_match', 'intent'):
+        assert any(line.startswith(f'ai_stage_seconds_count{{stage="{stage}"}}') for line in lines), stage
+    assert 'ai_response_cache_lookups_total{result="hit"} 1' in lines
+    assert f'ai_knowledge_entries {ai_brain.get_ai().knowledge_size}' in lines
+    assert '# TYPE ai_response_confidence histogram' in lines
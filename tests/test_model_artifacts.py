@@ -0,0 +1,79 @@
+import numpy as np
+
+import ai_brain
+from conftest import entries
+
+
+def test_unchanged_corpus_adopts_the_published_generation(make_ai, collection):
+    collection.insert_many(entries(50))
+    first = make_ai()
+
+    second = make_ai()
+
+    assert second.snapshot.generation == first.snapshot.generation
+    assert isinstance(second.snapshot.index.partitions['en']._data, np.memmap)
+
+
+def test_new_entries_are_appended_to_an_adopted_generation(make_ai, collection):
+    collection.insert_many(entries(50))
+    first = make_ai()
+    collection.insert_many(entries(2, prefix='added later'))
+
+    second = make_ai()
+
+    # Mapped from the first generation; the new entries may already be published as a delta on it
+    assert second.snapshot.base == first.snapshot.generation
+    assert second.get_response('added later 1 part')['answer'] == 'a1'
+
+
+def test_changed_corpus_is_refitted(make_ai, collection):
+    collection.insert_many(entries(50))
+    first = make_ai()
+    collection.delete_one({'question': 'how to thing 3 part'})
+
+    second = make_ai()
+
+    assert second.snapshot.generation != first.snapshot.generation
+    assert 'how to thing 3 part' not in second.snapshot.question_rows
+
+
+def test_generation_fitted_with_other_parameters_is_not_adopted(make_ai, collection, monkeypatch):
+    collection.insert_many(entries(50))
+    first = make_ai()
+    monkeypatch.setattr(ai_brain, 'INDEX_PRUNE', 0.01)
+
+    second = make_ai()
+
+    assert second.snapshot.generation != first.snapshot.generation
+    assert second.store.read_meta(second.snapshot.generation)['params'].endswith(':prune=0.01')
+
+
+def test_drifted_generation_is_refitted_not_adopted(make_ai, monkeypatch):
+    ai = make_ai()
+    # The refit the drift asks for waits until the generation is published
+    monkeypatch.setattr(ai_brain, 'RETRAIN_DEBOUNCE', 60)
+    ai.add_training_data('how do i make a door open', 'tween it')
+    assert ai.snapshot.index.needs_refit
+    ai.publish_now()
+    meta = ai.store.read_meta(ai.snapshot.generation)
+    assert meta['stale'] == ['en']
+
+    ai.train_model(wait=True)
+
+    assert not ai.snapshot.index.needs_refit
+    assert ai.get_response('how to use a remote event')['answer'] != 'tween it'
+    assert ai.get_response('how do i make a door open')['answer'] == 'tween it'
+
+
+def test_loaded_generation_keeps_its_stale_partitions(make_ai, monkeypatch):
+    ai = make_ai()
+    # The refit the drift asks for waits until the generation is published
+    monkeypatch.setattr(ai_brain, 'RETRAIN_DEBOUNCE', 60)
+    ai.add_training_data('how do i make a door open', 'tween it')
+    ai.publish_now()
+    name = ai.snapshot.generation
+
+    snap = ai._load_generation(name, ai.store.read_meta(name))
+
+    assert snap.index.stale == {'en'}
+    assert snap.index.needs_refit
@@ -0,0 +1,63 @@
+import threading
+
+import ai_brain
+from conftest import entries, wait_for
+
+
+def test_rebuild_swaps_in_a_new_snapshot(make_ai, collection):
+    ai = make_ai()
+    old = ai.snapshot
+    size = len(old.question_rows)
+
+    collection.insert_many(entries(20))
+    ai.train_model(wait=True)
+
+    assert ai.snapshot is not old
+    assert ai.snapshot.version > old.version
+    assert ai.knowledge_size == size + 20
+    # A reader still holding the old snapshot sees it unchanged
+    assert len(old.question_rows) == size
+    assert ai.get_response('how to thing 7 part')['answer'] == 'a7'
+
+
+def test_readers_see_whole_snapshots_during_rebuilds(make_ai, collection):
+    collection.insert_many(entries(20))
+    ai = make_ai()
+    ai.response_cache.maxsize = 0
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            snap = ai.snapshot
+            row = snap.question_rows.get('how to thing 7 part')
+            if row is None or snap.corpus[row]['answer'] != 'a7':
+                errors.append(row)
+            if ai.get_response('how to thing 7 part')['answer'] != 'a7':
+                errors.append('answer')
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for batch in range(5):
+            collection.insert_many(entries(10, f'how to batch {batch}'))
+            ai.train_model(wait=True)
+    finally:
+        stop.set()
+        reader.join()
+
+    assert errors == []
+    assert ai.knowledge_size == collection.count_documents({})
+
+
+def test_retrain_requests_are_coalesced_into_one_background_rebuild(make_ai, collection, monkeypatch):
+    ai = make_ai()
+    monkeypatch.setattr(ai_brain, 'RETRAIN_DEBOUNCE', 0.3)
+    rebuilds = ai.rebuilds
+
+    for i in range(5):
+        collection.insert_one({'question': f'queued {i}', 'answer': 'q', 'category': 'x', 'language': 'en'})
+        ai.train_model()
+
+    assert wait_for(lambda: ai.knowledge_size == collection.count_documents({}))
+    assert ai.rebuilds == rebuilds + 1
@@ -0,0 +1,63 @@
+from ai_brain import ResponseCache
+from conftest import wait_for
+
+
+def test_cache_hits_until_the_version_changes():
+    cache = ResponseCache(maxsize=4, ttl=60)
+    assert cache.get('hi', 1) is None
+    cache.put('hi', 1, {'answer': 'hello'})
+
+    assert cache.get('hi', 1) == {'answer': 'hello'}
+    assert cache.get('hi', 2) is None
+
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 2, 1)
+    # A response computed against the old version is not stored
+    cache.put('hi', 1, {'answer': 'stale'})
+    assert cache.get('hi', 2) is None
+
+
+def test_cache_evicts_the_least_recently_used_entry():
+    cache = ResponseCache(maxsize=2, ttl=60)
+    for question in ('a', 'b'):
+        # Responses are stored for the version the last lookup saw
+        cache.get(question, 1)
+        cache.put(question, 1, {'answer': question})
+    cache.get('a', 1)
+
+    cache.put('c', 1, {'answer': 'c'})
+
+    assert cache.get('b', 1) is None
+    assert cache.get('a', 1) == {'answer': 'a'}
+    assert cache.evictions == 1
+
+
+def test_cache_entries_expire_after_the_ttl():
+    cache = ResponseCache(maxsize=4, ttl=0.05)
+    cache.get('hi', 1)
+    cache.put('hi', 1, {'answer': 'hello'})
+
+    assert wait_for(lambda: cache.get('hi', 1) is None)
+    assert cache.get_stats()['size'] == 0
+
+
+def test_cached_response_is_a_copy():
+    cache = ResponseCache(maxsize=4, ttl=60)
+    cache.get('hi', 1)
+    cache.put('hi', 1, {'answer': 'hello'})
+
+    cache.get('hi', 1)['answer'] = 'changed'
+
+    assert cache.get('hi', 1) == {'answer': 'hello'}
+
+
+def test_teach_invalidates_cached_responses(make_ai):
+    ai = make_ai()
+    question = 'how do i make a sword'
+    first = ai.get_response(question)
+    assert ai.get_response(question) == first
+    assert ai.response_cache.hits == 1
+
+    ai.add_training_data(question, 'use a tool with a handle')
+
+    assert ai.get_response(question)['answer'] == 'use a tool with a handle'
+    assert ai.response_cache.invalidations >= 1
@@ -0,0 +1,85 @@
+import ai_brain
+from conftest import wait_for
+
+
+def test_deleted_bulk_entry_leaves_the_overlay(make_ai):
+    ai = make_ai()
+    ai.add_training_data_bulk([('secret door code', 'it is 1234', 'x', 'en')], retrain=False)
+    assert ai.get_response('secret door code')['answer'] == 'it is 1234'
+    size = ai.knowledge_size
+
+    assert ai.delete_knowledge('secret door code')
+
+    assert ai.get_response('secret door code')['source'] != 'exact_match'
+    assert ai.knowledge_size == size - 1
+    ai.train_model(wait=True)
+    ai.train_model(wait=True)
+    assert ai.get_response('secret door code')['source'] != 'exact_match'
+    assert len(ai._overlay) == 0
+
+
+def test_overlay_entries_are_counted_until_the_rebuild(make_ai):
+    ai = make_ai()
+    size = ai.knowledge_size
+
+    ai.add_training_data_bulk([('bulk one', 'b1', 'bulk', 'en'), ('bulk two', 'b2', 'bulk', 'en')], retrain=False)
+
+    stats = ai.get_stats()
+    assert ai.knowledge_size == stats['training_examples'] == size + 2
+    assert stats['category_breakdown']['bulk'] == 2
+    ai.train_model(wait=True)
+    assert len(ai._overlay) == 0
+    assert ai.knowledge_size == size + 2
+
+
+def test_teaching_an_overlay_question_updates_it(make_ai):
+    ai = make_ai()
+    ai.add_training_data_bulk([('bulk question', 'old answer', 'x', 'en')], retrain=False)
+
+    assert ai.add_training_data('bulk question', 'new answer')
+
+    assert ai.get_response('bulk question')['answer'] == 'new answer'
+    assert 'bulk question' not in ai._overlay
+
+
+def test_burst_of_bulk_writes_causes_a_handful_of_rebuilds(make_ai, monkeypatch):
+    ai = make_ai()
+    monkeypatch.setattr(ai_brain, 'RETRAIN_DEBOUNCE', 0.2)
+    rebuilds = ai.rebuilds
+
+    for i in range(100):
+        ai.add_training_data_bulk([(f'burst question {i}', f'burst answer {i}', 'burst', 'en')])
+        # Answered from the overlay before any rebuild
+        assert ai.get_response(f'burst question {i}')['answer'] == f'burst answer {i}'
+
+    assert wait_for(lambda: len(ai._overlay) == 0)
+    assert ai.rebuilds - rebuilds <= 3
+    assert ai.get_stats()['category_breakdown']['burst'] == 100
+
+
+def test_pending_writes_past_the_limit_rebuild_without_waiting(make_ai, monkeypatch):
+    ai = make_ai()
+    monkeypatch.setattr(ai_brain, 'RETRAIN_DEBOUNCE', 60)
+    monkeypatch.setattr(ai_brain, 'RETRAIN_MAX_PENDING', 5)
+
+    ai.add_training_data_bulk([(f'pending question {i}', 'p', 'x', 'en') for i in range(3)])
+    ai.add_training_data_bulk([(f'pending question {i}', 'p', 'x', 'en') for i in range(3, 6)])
+
+    assert wait_for(lambda: len(ai._overlay) == 0)
+    assert 'pending question 5' in ai.snapshot.question_rows
+
+
+def test_base_knowledge_is_loaded_with_one_rebuild(make_ai):
+    ai = make_ai()
+
+    assert ai.knowledge_size > 0
+    assert ai.rebuilds == 1
+
+
+def test_teach_route_does_not_retrain(client):
+    ai = ai_brain.get_ai()
+
+    assert client.post('/teach', json={'question': 'how to make a part red', 'answer': 'set Color'}).status_code == 200
+
+    assert ai.rebuilds == 1
+    assert ai.get_response('how to make a part red')['answer'] == 'set Color'
@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+
+import ai_brain
+from ai_brain import IndexStore
+from conftest import entries, wait_for
+
+
+def test_other_worker_sees_published_writes(make_ai):
+    writer = make_ai()
+    reader = make_ai()
+
+    writer.add_training_data('how to raycast stuff', 'raycast answer')
+
+    assert wait_for(lambda: writer.snapshot.generation != reader.snapshot.generation
+                    and not writer._pending_ops)
+    assert wait_for(lambda: reader.get_response('how to raycast stuff')['answer'] == 'raycast answer')
+
+
+def test_writes_to_a_mapped_generation_leave_its_arrays_mapped(make_ai, collection):
+    collection.insert_many(entries(50))
+    make_ai()
+    ai = make_ai()
+    index = ai.snapshot.index.partitions['en']
+    base = index._data
+    deleted = ai.snapshot.question_rows['how to thing 3 part']
+
+    ai.add_training_data('how to thing weld part', 'weld answer')
+    ai.delete_knowledge('how to thing 3 part')
+
+    assert index._data is base and isinstance(base, np.memmap)
+    assert index.top_k('how to thing weld part', 1)[0][0] == index._tail_row_ids[0]
+    assert all(row != deleted for row, _ in index.top_k('how to thing 3 part', 50))
+
+
+def test_mapped_lookups_follow_local_writes(make_ai, collection):
+    collection.insert_many(entries(50))
+    make_ai()
+    ai = make_ai()
+    rows = ai.snapshot.question_rows
+    assert isinstance(rows, ai_brain.QuestionRows)
+    size = len(rows)
+    assert ai.snapshot.corpus[rows['how to thing 7 part']]['answer'] == 'a7'
+    assert 'how to thing 70 part' not in rows
+
+    ai.delete_knowledge('how to thing 7 part')
+    ai.add_training_data('how to thing 70 part', 'a70')
+
+    rows = ai.snapshot.question_rows
+    assert 'how to thing 7 part' not in rows
+    assert ai.snapshot.corpus[rows['how to thing 70 part']]['answer'] == 'a70'
+    assert len(rows) == size
+    combined = [item['question'] for item in ai.combine_knowledge(['part'])]
+    assert 'how to thing 70 part' in combined and 'how to thing 7 part' not in combined
+
+
+def test_writes_are_published_as_deltas_until_compaction(make_ai, collection, monkeypatch):
+    collection.insert_many(entries(50))
+    writer = make_ai()
+    full = writer.snapshot.generation
+
+    writer.add_training_data('how to thing delta part', 'delta answer')
+    writer.delete_knowledge('how to thing 3 part')
+
+    assert wait_for(lambda: not writer._pending_ops and writer.snapshot.generation != full)
+    assert writer.store.read_meta(writer.snapshot.generation)['base'] == full
+    reader = make_ai()
+    assert reader.snapshot.generation == writer.snapshot.generation
+    assert reader.get_response('how to thing delta part')['answer'] == 'delta answer'
+    assert 'how to thing 3 part' not in reader.snapshot.question_rows
+
+    monkeypatch.setattr(ai_brain, 'SHARED_INDEX_COMPACT_RATIO', 0.0)
+    writer.add_training_data('how to thing compact part', 'compact answer')
+    assert wait_for(lambda: not writer._pending_ops)
+    assert 'base' not in writer.store.read_meta(writer.snapshot.generation)
+    assert wait_for(lambda: reader.get_response('how to thing compact part')['answer'] == 'compact answer')
+
+
+def test_old_generations_are_removed_except_the_base_of_a_delta(make_ai, collection, monkeypatch):
+    collection.insert_many(entries(50))
+    ai = make_ai()
+    # Only the explicit publishes below write generations
+    monkeypatch.setattr(ai_brain, 'SHARED_INDEX_PUBLISH_DELAY', 60)
+    base = ai.snapshot.generation
+
+    for i in range(5):
+        ai.add_training_data(f'how to thing extra {i} part', 'extra')
+        ai.publish_now()
+
+    names = [name for name in os.listdir(ai.store.directory) if name.startswith('gen-')]
+    assert ai.store.read_meta(ai.snapshot.generation)['base'] == base
+    assert base in names
+    assert len(names) == IndexStore.KEEP_GENERATIONS + 1
@@ -0,0 +1,59 @@
+from collections import Counter
+
+import ai_brain
+from conftest import wait_for
+
+
+def test_counters_follow_teach_and_delete(make_ai):
+    ai = make_ai()
+    before = ai.get_stats()
+
+    ai.add_training_data('how to spawn a car', 'use a vehicle seat', 'vehicles', 'en')
+    taught = ai.get_stats()
+    assert ai.delete_knowledge('how to spawn a car')
+    after = ai.get_stats()
+
+    assert taught['training_examples'] == before['training_examples'] + 1
+    assert taught['category_breakdown']['vehicles'] == 1
+    assert taught['languages']['en'] == before['languages']['en'] + 1
+    assert (after['training_examples'], after['category_breakdown'], after['languages']) == \
+        (before['training_examples'], before['category_breakdown'], before['languages'])
+
+
+def test_counters_match_a_recount_after_writes_and_a_rebuild(make_ai, collection):
+    ai = make_ai()
+    ai.add_training_data('kamusta ka na', 'mabuti', 'greeting', 'tl')
+    ai.add_training_data('hi', 'hello again', 'small_talk', 'en')
+    ai.delete_knowledge('thanks')
+
+    ai.train_model(wait=True)
+    # Write-behind mode stores the writes in the background
+    assert wait_for(lambda: ai.journal.pending_count == 0)
+
+    docs = list(collection.find())
+    stats = ai.get_stats()
+    assert stats['category_breakdown'] == dict(Counter(doc.get('category', 'general') for doc in docs))
+    assert stats['languages'] == dict(Counter(doc.get('language', 'en') for doc in docs))
+
+
+def test_chat_route_returns_the_slim_response(client):
+    response = client.post('/chat', json={'question': 'hi'})
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['source'] == 'exact_match'
+    assert body['knowledge_count'] == ai_brain.get_ai().knowledge_size
+    assert client.post('/chat', json={'question': '  '}).status_code == 400
+
+
+def test_teach_and_delete_routes(client):
+    count = client.get('/stats').get_json()['training_examples']
+
+    taught = client.post('/teach', json={'question': 'how to spawn a car', 'answer': 'use a vehicle seat'})
+    assert taught.status_code == 200
+    assert taught.get_json()['knowledge_count'] == count + 1
+    assert client.post('/teach', json={'question': 'no answer'}).status_code == 400
+
+    assert client.post('/delete', json={'question': 'how to spawn a car'}).status_code == 200
+    assert client.post('/delete', json={'question': 'how to spawn a car'}).status_code == 404
+    assert client.get('/stats').get_json()['training_examples'] == count
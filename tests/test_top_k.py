@@ -0,0 +1,52 @@
+import numpy as np
+
+from ai_brain import TfidfIndex
+
+
+QUESTIONS = ['how to make a part', 'how to make a gui', 'how to make a part', 'what is a tween',
+             'how to make a part move', 'how to use a remote event', 'how to make a part']
+
+
+def brute_force(index, question, k):
+    """(row id, score) pairs from a dense product over every row, highest score then lowest row first"""
+    scores = index.matrix().toarray() @ index.transform([question]).toarray().ravel()
+    ranked = sorted((-score, row) for row, score in zip(index.row_ids.tolist(), scores) if score > 0)
+    return [(row, -score) for score, row in ranked[:k]]
+
+
+def assert_same(results, expected):
+    assert [row for row, _ in results] == [row for row, _ in expected]
+    assert np.allclose([score for _, score in results], [score for _, score in expected])
+
+
+def test_top_k_matches_a_dense_ranking_with_ties_on_the_lowest_rows():
+    index = TfidfIndex()
+    index.fit(QUESTIONS)
+
+    for k in (1, 2, 3, 5, 20):
+        assert_same(index.top_k('how to make a part', k), brute_force(index, 'how to make a part', k))
+    # Three identical rows tie; the cut keeps the lowest two
+    assert [row for row, _ in index.top_k('how to make a part', 2)] == [0, 2]
+
+
+def test_top_k_ranks_tail_rows_and_skips_removed_ones():
+    index = TfidfIndex(drift_threshold=1.0)
+    index.fit(QUESTIONS)
+    index.extend(['how to make a part', 'what is a gui'])
+    index.remove(0)
+    index.remove(7)
+
+    assert_same(index.top_k('how to make a part', 4), brute_force(index, 'how to make a part', 4))
+    assert [row for row, _ in index.top_k('how to make a part', 3)] == [2, 6, 4]
+    assert index.top_k('zzz', 3) == []
+
+
+def test_chat_offers_the_runners_up_as_alternatives(client):
+    client.post('/teach', json={'question': 'how do i make a part spin', 'answer': 'use a hinge'})
+    client.post('/teach', json={'question': 'how do i make a part glow', 'answer': 'use a light'})
+
+    body = client.post('/chat', json={'question': 'how do i make a part spin fast'}).get_json()
+
+    confidences = [alt['confidence'] for alt in body['alternatives']]
+    assert body['alternatives'] and confidences == sorted(confidences, reverse=True)
+    assert 'how do i make a part spin' not in [alt['question'] for alt in body['alternatives']]
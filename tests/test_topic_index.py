@@ -0,0 +1,50 @@
+import numpy as np
+
+import ai_brain
+from conftest import entries
+
+
+TOPIC_SETS = (['part', 'kill'], ['gui', 'loop'], ['tween'], ['teleport', 'player', 'event'], ['table'])
+
+
+def scan(ai, topics):
+    """Questions of every live row with a keyword of one of the topics, in row order"""
+    keywords = [keyword for topic in topics for keyword in ai.topic_keywords[topic]]
+    return [item['question'] for item in ai.snapshot.corpus
+            if item is not None and any(keyword in item['question'] for keyword in keywords)]
+
+
+def combined(ai, topics, limit=None):
+    return [item['question'] for item in ai.combine_knowledge(topics, limit)]
+
+
+def test_postings_follow_teach_and_delete(make_ai, collection, monkeypatch):
+    # No shared generations: the postings are built in memory
+    monkeypatch.setattr(ai_brain, 'ARTIFACT_DIR', '')
+    collection.insert_many(entries(30, 'kill the gui'))
+    ai = make_ai()
+    assert not ai.snapshot.topic_rows.postings
+
+    ai.add_training_data('tween a part to the player', 'tween answer')
+    ai.delete_knowledge('kill the gui 4 part')
+    ai.delete_knowledge('how do i make a part')
+
+    for topics in TOPIC_SETS:
+        assert combined(ai, topics) == scan(ai, topics), topics
+    assert combined(ai, ['part', 'kill'], 3) == scan(ai, ['part', 'kill'])[:3]
+    assert 'tween a part to the player' in combined(ai, ['tween'])
+    assert combined(ai, []) == []
+
+
+def test_mapped_postings_follow_teach_and_delete(make_ai, collection):
+    collection.insert_many(entries(30, 'kill the gui'))
+    make_ai()
+    ai = make_ai()
+    assert isinstance(ai.snapshot.topic_rows.postings['kill'], np.memmap)
+
+    ai.add_training_data('loop over a table', 'for loop answer')
+    ai.delete_knowledge('kill the gui 9 part')
+
+    for topics in TOPIC_SETS:
+        assert combined(ai, topics) == scan(ai, topics), topics
+    assert 'kill the gui 9 part' not in combined(ai, ['kill'])
@@ -0,0 +1,115 @@
+import ai_brain
+from ai_brain import WriteJournal
+from conftest import wait_for
+
+
+def test_journal_replays_records_after_a_crash(tmp_path):
+    directory = str(tmp_path / 'journal')
+    journal = WriteJournal(directory)
+    journal.append([('set', {'question': 'one', 'answer': '1'}), ('delete', {'question': 'two'})])
+    journal.mark_flushed(journal.unflushed(1)[0])
+    with open(journal.path, 'ab') as f:
+        f.write(b'{"kind": "set", "doc": {"quest')
+    # Crash: the slot lock goes away with the process
+    journal._file.close()
+    journal._lock_file.close()
+
+    reopened = WriteJournal(directory)
+
+    assert reopened.slot == journal.slot
+    assert [(kind, doc['question']) for _, kind, doc, _ in reopened.unflushed(10)] == [('delete', 'two')]
+
+
+def test_journal_takes_over_orphaned_slots(tmp_path):
+    directory = str(tmp_path / 'journal')
+    first = WriteJournal(directory)
+    second = WriteJournal(directory)
+    second.append([('insert', {'question': 'orphan', 'answer': 'o'})])
+    second._file.close()
+    second._lock_file.close()
+
+    third = WriteJournal(directory)
+
+    assert third.slot == second.slot
+    assert [doc['question'] for _, _, doc, _ in third.unflushed(10)] == ['orphan']
+    assert first.pending_count == 0
+
+
+def test_rebuild_queues_unflushed_journal_records_for_publishing(make_ai, monkeypatch):
+    ai = make_ai()
+    monkeypatch.setattr(ai_brain, 'WRITE_BEHIND', True)
+    # Keep the records in the journal
+    ai._flush_journal = lambda: None
+    ai.add_training_data('journaled question', 'journaled answer')
+    ai.train_model(wait=True)
+    assert ai.get_response('journaled question')['answer'] == 'journaled answer'
+
+    ai.publish_now()
+
+    name = ai.snapshot.generation
+    published = ai._load_generation(name, ai.store.read_meta(name))
+    assert 'journaled question' in published.question_rows
+
+
+def test_write_behind_start_fits_the_journaled_base_knowledge(make_ai, monkeypatch):
+    monkeypatch.setattr(ai_brain, 'WRITE_BEHIND', True)
+
+    ai = make_ai()
+
+    assert ai.knowledge_size > 0
+    assert ai.snapshot.generation is not None
+    assert not ai.snapshot.index.stale
+    assert ai.get_response('hi')['source'] == 'exact_match'
+    # Counted from the journaled corpus, not from the still empty collection
+    stats = ai.get_stats()
+    assert sum(stats['languages'].values()) == sum(stats['category_breakdown'].values()) == ai.knowledge_size
+
+
+class CountingBulkWrites:
+    """Collection proxy that counts bulk_write calls"""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.bulk_writes = 0
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def bulk_write(self, ops, **kwargs):
+        self.bulk_writes += 1
+        return self.collection.bulk_write(ops, **kwargs)
+
+
+def test_write_behind_teaches_are_flushed_in_batches(make_ai, collection, monkeypatch):
+    monkeypatch.setattr(ai_brain, 'WRITE_BEHIND', True)
+    counting = CountingBulkWrites(collection)
+    ai = make_ai(counting)
+    assert wait_for(lambda: ai.journal.pending_count == 0)
+    monkeypatch.setattr(ai_brain, 'JOURNAL_FLUSH_INTERVAL', 0.3)
+    flushes = counting.bulk_writes
+
+    for i in range(10):
+        assert ai.add_training_data(f'journal question {i}', f'journal answer {i}')
+        assert ai.get_response(f'journal question {i}')['answer'] == f'journal answer {i}'
+    assert ai.delete_knowledge('journal question 0')
+
+    assert wait_for(lambda: ai.journal.pending_count == 0)
+    assert counting.bulk_writes - flushes <= 2
+    assert collection.count_documents({'question': {'$regex': '^journal question'}}) == 9
+    assert collection.find_one({'question': 'journal question 0'}) is None
+
+
+def test_journal_is_replayed_into_mongodb_after_a_restart(make_ai, collection, monkeypatch):
+    monkeypatch.setattr(ai_brain, 'WRITE_BEHIND', True)
+    crashed = make_ai()
+    assert wait_for(lambda: crashed.journal.pending_count == 0)
+    crashed._flush_journal = lambda: None
+    crashed.add_training_data('survives the crash', 'journaled')
+    assert collection.find_one({'question': 'survives the crash'}) is None
+    crashed.journal._file.close()
+    crashed.journal._lock_file.close()
+
+    restarted = make_ai()
+
+    assert wait_for(lambda: collection.find_one({'question': 'survives the crash'}) is not None)
+    assert restarted.get_response('survives the crash')['answer'] == 'journaled'